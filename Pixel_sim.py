@@ -1,6 +1,5 @@
 import pygame
 import numpy as np
-from scipy.ndimage import convolve
 
 # Initialize Pygame
 pygame.init()
@@ -29,7 +28,24 @@ class GameOfLife:
         
         # Pre-allocate working arrays for performance
         self._temp_grid = np.zeros_like(self.grid)
-        self._random_array = np.zeros((height, width), dtype=np.float32)
+        self._random_array = np.empty((height, width), dtype=np.float32)
+        self._cell_mask = np.empty((height, width), dtype=bool)
+        self._empty_mask = np.empty((height, width), dtype=bool)
+        
+        # One PCG64 generator reused for every random draw
+        self._rng = np.random.default_rng()
+        
+        # Cell states double as 8-bit palette indices, so drawing needs no color conversion
+        self._palette = [BLACK, WHITE, GREEN]
+        
+        # Bit-packed Life bitboards: 64 cells per uint64 word, little-endian bit order
+        self._words_per_row = (width + 63) // 64
+        # Two persistent planes (live cells, trees), about 260 KB each at 1920x1080, so
+        # a whole Life tick's packed working set stays cache-resident
+        self._packed_planes = np.zeros((2, height, self._words_per_row * 8), dtype=np.uint8)
+        # Valid bits in the last word of each row (0 when width is a multiple of 64)
+        self._tail_bits = width % 64
+        self._tail_mask = np.uint64((1 << self._tail_bits) - 1)
         
         # Zoom and pan variables
         self.zoom_level = 1
@@ -59,24 +75,63 @@ class GameOfLife:
         self.buttons = []
         self.sliders = []
         
-        # Pre-computed kernels for different radii to avoid recreating them
-        self.kernels = {}
-        self.gol_kernel = np.array([[1, 1, 1], [1, 0, 1], [1, 1, 1]], dtype=np.uint8)
+        # Pre-computed dilation steps for different spread radii
+        self.reach_steps = {}
         
         # Frame counter for optimization
         self.frame_count = 0
         
-        self.setup_ui()
+        # Set whenever the grid, view or UI changes; draw() skips frames while it is clear
+        self._dirty = True
         
-    def get_tree_kernel(self, radius):
-        """Get or create a cached kernel for tree spreading"""
-        if radius not in self.kernels:
-            kernel_size = 2 * radius + 1
-            kernel = np.ones((kernel_size, kernel_size), dtype=np.uint8)
-            kernel[radius, radius] = 0
-            self.kernels[radius] = kernel
-        return self.kernels[radius]
+        self.setup_ui()
         
+    @staticmethod
+    def _or_rolled_rows(src, dst, shift):
+        """OR src rolled by shift rows into dst without allocating"""
+        shift %= src.shape[0]
+        if shift == 0:
+            dst |= src
+            return
+        dst[shift:] |= src[:-shift]
+        dst[:shift] |= src[-shift:]
+    
+    def get_reach_steps(self, radius):
+        """Get or create the cached dilation schedule for a spread radius
+        
+        A window of half-width a grows to a + b by ORing copies shifted by +-b,
+        which stays gap-free while b <= 2a + 1. Growing greedily reaches radius
+        10 in three steps (1, 3, 6) instead of ten single-cell passes.
+        """
+        if radius not in self.reach_steps:
+            steps = []
+            reach = 0
+            while reach < radius:
+                step = min(2 * reach + 1, radius - reach)
+                steps.append(step)
+                reach += step
+            self.reach_steps[radius] = tuple(steps)
+        return self.reach_steps[radius]
+    
+    def get_tree_reach(self, trees, radius):
+        """Mark every cell within radius of a tree on packed rows (toroidal)
+        
+        The square (2r+1)x(2r+1) neighborhood is separable into a vertical pass
+        over rolled rows and a horizontal pass over shifted words.
+        """
+        steps = self.get_reach_steps(radius)
+        
+        reach = trees
+        for step in steps:
+            grown = reach.copy()
+            self._or_rolled_rows(reach, grown, step)
+            self._or_rolled_rows(reach, grown, -step)
+            reach = grown
+        
+        for step in steps:
+            reach = reach | self._shift_west(reach, step) | self._shift_east(reach, step)
+        return reach
+    
     def setup_ui(self):
         """Setup UI buttons and sliders"""
         self.buttons = []
@@ -156,64 +211,199 @@ class GameOfLife:
             'active': True
         })
         
+        # Static parts of the UI are rendered once; widgets keep a cached surface
+        # that is only re-rendered when their state changes
+        self._panel_surface = pygame.Surface((self.ui_panel_width, HEIGHT))
+        self._panel_surface.fill(DARK_GRAY)
+        title = self.font.render('Controls', True, WHITE)
+        self._panel_surface.blit(title, (20, 5))
+        
+        self._show_button_surface = pygame.Surface((20, 20))
+        pygame.draw.rect(self._show_button_surface, DARK_GRAY, self._show_button_surface.get_rect())
+        pygame.draw.rect(self._show_button_surface, WHITE, self._show_button_surface.get_rect(), 2)
+        text = self.small_font.render('>', True, WHITE)
+        self._show_button_surface.blit(text, (6, 2))
+        
+        for button in self.buttons:
+            self._render_button(button)
+        for slider in self.sliders:
+            self._render_slider(slider)
+    
+    def _render_button(self, button):
+        """Render a button into its cached surface"""
+        if button['action'] == 'toggle_ui':
+            color, font = RED, self.small_font
+        elif button['action'] in ['randomize', 'clear']:
+            color, font = LIGHT_GRAY, self.font
+        else:
+            color, font = (GREEN if button['active'] else RED), self.font
+        
+        surface = pygame.Surface(button['rect'].size)
+        local_rect = surface.get_rect()
+        pygame.draw.rect(surface, color, local_rect)
+        pygame.draw.rect(surface, WHITE, local_rect, 2)
+        
+        text = font.render(button['text'], True, BLACK if color == LIGHT_GRAY else WHITE)
+        surface.blit(text, text.get_rect(center=local_rect.center))
+        
+        button['cached_surface'] = surface
+        button['dirty'] = False
+    
+    def _render_slider(self, slider):
+        """Render a slider with its label and value into its cached surface"""
+        if slider['param'] == 'spread_radius':
+            value_text = f"{int(slider['value'])}"
+        elif slider['param'] == 'spontaneous_chance':
+            value_text = f"{slider['value']:.6f}"
+        else:
+            value_text = f"{slider['value']:.4f}"
+        value_surface = self.small_font.render(value_text, True, WHITE)
+        
+        # The surface spans the label above the track, the handle overhanging it
+        # by 5px on each side and the value text to its right
+        width, height = slider['rect'].size
+        surface = pygame.Surface((width + 15 + value_surface.get_width(), height + 22))
+        surface.fill(DARK_GRAY)
+        offset = (5 - slider['rect'].x, 20 - slider['rect'].y)
+        track_rect = slider['rect'].move(offset)
+        
+        label_text = self.small_font.render(slider['label'], True, WHITE)
+        surface.blit(label_text, (5, 0))
+        
+        pygame.draw.rect(surface, GRAY, track_rect)
+        pygame.draw.rect(surface, WHITE, track_rect, 2)
+        
+        percentage = (slider['value'] - slider['min_val']) / (slider['max_val'] - slider['min_val'])
+        handle_x = slider['rect'].x + percentage * width
+        handle_rect = pygame.Rect(handle_x - 5, slider['rect'].y - 2, 10, height + 4)
+        pygame.draw.rect(surface, WHITE, handle_rect.move(offset))
+        
+        surface.blit(value_surface, (track_rect.right + 10, track_rect.y))
+        
+        slider['cached_surface'] = surface
+        slider['dirty'] = False
+        
     def randomize_grid(self, density=0.3):
         """Initialize grid with random live cells"""
-        self.grid = np.random.choice([0, 1], size=(self.height, self.width), 
-                                   p=[1-density, density]).astype(np.uint8)
+        self._rng.random(out=self._random_array, dtype=np.float32)
+        self.grid = (self._random_array < density).astype(np.uint8)
+    
+    def _pack_rows(self, mask, plane=0):
+        """Pack a boolean (H, W) mask into (H, W/64) uint64 bitboards
+        
+        The result is a view of a persistent plane buffer and is overwritten by
+        the next pack into the same plane.
+        """
+        packed = self._packed_planes[plane]
+        packed[:, :(self.width + 7) // 8] = np.packbits(mask, axis=1, bitorder='little')
+        return packed.view('<u8')
+    
+    def _unpack_rows(self, words):
+        """Unpack (H, W/64) uint64 bitboards back into a boolean (H, W) mask"""
+        return np.unpackbits(words.view(np.uint8), axis=1, count=self.width,
+                             bitorder='little').view(bool)
+    
+    def _tail_word(self, words):
+        """Gather the last 64 valid cells of each packed row into one word"""
+        if not self._tail_bits:
+            return words[:, -1]
+        tail = words[:, -1] << np.uint64(64 - self._tail_bits)
+        if words.shape[1] > 1:
+            tail |= words[:, -2] >> np.uint64(self._tail_bits)
+        return tail
+    
+    def _shift_west(self, words, shift=1):
+        """Shift packed rows so each cell holds the cell shift to its west (toroidal)"""
+        # Shift bits within words, carrying across word boundaries
+        shifted = words << np.uint64(shift)
+        shifted[:, 1:] |= words[:, :-1] >> np.uint64(64 - shift)
+        
+        # Wrap the last cells of the row around to the front
+        shifted[:, 0] |= self._tail_word(words) >> np.uint64(64 - shift)
+        if self._tail_bits:
+            shifted[:, -1] &= self._tail_mask
+        return shifted
+    
+    def _shift_east(self, words, shift=1):
+        """Shift packed rows so each cell holds the cell shift to its east (toroidal)"""
+        shifted = words >> np.uint64(shift)
+        shifted[:, :-1] |= words[:, 1:] << np.uint64(64 - shift)
+        
+        # Wrap the first cells of the row around to the back, possibly straddling two words
+        head = words[:, 0] & np.uint64((1 << shift) - 1)
+        word, bit = divmod(self.width - shift, 64)
+        shifted[:, word] |= head << np.uint64(bit)
+        if bit + shift > 64:
+            shifted[:, word + 1] |= head >> np.uint64(64 - bit)
+        return shifted
+    
+    def _neighbor_bitplanes(self, alive):
+        """Count live neighbors of every cell with bit-parallel (SWAR) adders
+        
+        Returns bitplanes (s0, s1, fours), 64 cells per uint64 word: the two low
+        bits of each cell's neighbor count and a flag for counts of 4 or more.
+        The Life rule never needs to tell 4..8 apart, so the count saturates.
+        """
+        west = self._shift_west(alive)
+        east = self._shift_east(alive)
+        
+        # Vertical neighbors: toroidal wrap is just a roll of whole rows
+        neighbors = (west, east,
+                     np.roll(alive, 1, axis=0), np.roll(alive, -1, axis=0),
+                     np.roll(west, 1, axis=0), np.roll(west, -1, axis=0),
+                     np.roll(east, 1, axis=0), np.roll(east, -1, axis=0))
+        
+        # Carry-save adder tree reducing the 8 one-bit inputs to a saturating count
+        def full_add(a, b, c):
+            partial = a ^ b
+            return partial ^ c, (a & b) | (partial & c)
+        
+        ones_a, twos_a = full_add(*neighbors[0:3])
+        ones_b, twos_b = full_add(*neighbors[3:6])
+        ones_c, twos_c = neighbors[6] ^ neighbors[7], neighbors[6] & neighbors[7]
+        s0, twos_d = full_add(ones_a, ones_b, ones_c)
+        twos_ab, fours_a = full_add(twos_a, twos_b, twos_c)
+        s1, fours_b = twos_ab ^ twos_d, twos_ab & twos_d
+        return s0, s1, fours_a | fours_b
     
     def apply_game_of_life_rule(self):
         """Apply Game of Life rules using optimized vectorized operations"""
         if not self.rules['game_of_life']:
             return
         
-        # Check if there are any white pixels - optimized check
-        has_white_pixels = np.any(self.grid == 1)
-        
-        # If no white pixels exist, spawn a 2x2 block - optimized version
-        if not has_white_pixels:
-            # Find empty positions more efficiently
-            empty_y, empty_x = np.where(self.grid == 0)
-            if len(empty_y) > 0:
-                # Filter positions that can fit 2x2 block
-                valid_mask = (empty_x < self.width - 1) & (empty_y < self.height - 1)
-                valid_y = empty_y[valid_mask]
-                valid_x = empty_x[valid_mask]
-                
-                if len(valid_y) > 0:
-                    # Check if 2x2 area is empty for each valid position
-                    for i in range(min(100, len(valid_y))):  # Limit checks for performance
-                        y, x = valid_y[i], valid_x[i]
-                        if (self.grid[y:y+2, x:x+2] == 0).all():
-                            self.grid[y:y+2, x:x+2] = 1
-                            return
-            
-        # Optimized Game of Life calculation
-        living_grid = (self.grid == 1)
-        neighbors = convolve(living_grid.astype(np.uint8), self.gol_kernel, mode='wrap')
-        
-        gol_survive = living_grid & ((neighbors == 2) | (neighbors == 3))
-        gol_born = (self.grid == 0) & (neighbors == 3)
-        
-        # Tree conversion with 50% chance - optimized
-        trees_with_neighbors = (self.grid == 2) & (neighbors > 0)
-        if np.any(trees_with_neighbors):
-            self._random_array = np.random.random((self.height, self.width))
-            trees_convert = trees_with_neighbors & (self._random_array < 0.5)
-        else:
-            trees_convert = np.zeros_like(self.grid, dtype=bool)
+        # Bit-parallel Game of Life calculation on packed rows
+        alive = self._pack_rows(np.equal(self.grid, 1, out=self._cell_mask))
         
-        # Combine and apply 5% failure rate
-        should_be_white = gol_survive | gol_born | trees_convert
-        if np.any(should_be_white):
-            self._random_array = np.random.random((self.height, self.width))
-            actually_white = should_be_white & (self._random_array >= 0.05)
-        else:
-            actually_white = np.zeros_like(self.grid, dtype=bool)
+        # If no white pixels exist, spawn a 2x2 block - the packed rows make this check cheap
+        if not alive.any():
+            # Top-left corners of every fully empty 2x2 block, found with four shifted ANDs
+            empty = (self.grid == 0)
+            fits = empty[:-1, :-1] & empty[:-1, 1:] & empty[1:, :-1] & empty[1:, 1:]
+            corners = np.flatnonzero(fits)
+            if corners.size > 0:
+                y, x = divmod(int(corners[self._rng.integers(corners.size)]), self.width - 1)
+                self.grid[y:y+2, x:x+2] = 1
+                return
+        
+        trees = self._pack_rows(np.equal(self.grid, 2, out=self._cell_mask), plane=1)
+        s0, s1, fours = self._neighbor_bitplanes(alive)
+        
+        # Empty cells are born with exactly 3 neighbors, live cells survive with 2 or 3
+        gol_next = s1 & ~fours & (alive | s0) & ~trees
         
-        # Update grid efficiently
-        self._temp_grid.fill(0)
-        self._temp_grid[self.grid == 2] = 2  # Preserve trees not being converted
-        self._temp_grid[actually_white] = 1
+        # Trees next to life convert with 50% chance - one random bit per cell
+        coin_flips = self._rng.integers(0, 2**64, size=alive.shape, dtype=np.uint64)
+        trees_convert = trees & (s0 | s1 | fours) & coin_flips
+        
+        # Only the combined result leaves the packed domain, as a sparse list of cells
+        should_be_white = np.flatnonzero(self._unpack_rows(gol_next | trees_convert))
+        
+        # Apply 5% failure rate - random draws only for the candidate cells
+        survivors = should_be_white[self._rng.random(should_be_white.size, dtype=np.float32) >= 0.05]
+        
+        # Compose the next generation - trees stay trees unless converted
+        np.bitwise_and(self.grid, 2, out=self._temp_grid)
+        np.put(self._temp_grid, survivors, 1)
         self.grid, self._temp_grid = self._temp_grid, self.grid
     
     def apply_trees_rule(self):
@@ -221,35 +411,35 @@ class GameOfLife:
         if not self.rules['trees']:
             return
         
-        empty_cells = (self.grid == 0)
+        empty_cells = np.equal(self.grid, 0, out=self._empty_mask).ravel()
         
-        # Optimized spontaneous generation
-        if self.trees_config['spontaneous_chance'] > 0 and np.any(empty_cells):
-            self._random_array = np.random.random((self.height, self.width))
-            spontaneous_trees = empty_cells & (self._random_array < self.trees_config['spontaneous_chance'])
-            if np.any(spontaneous_trees):
-                self.grid[spontaneous_trees] = 2
-                empty_cells = (self.grid == 0)  # Update mask
+        # Spontaneous generation: every cell fires independently with a tiny chance, so
+        # draw how many fire this frame and pick that many distinct cells
+        cell_count = self.grid.size
+        spontaneous_count = self._rng.binomial(cell_count, self.trees_config['spontaneous_chance'])
+        new_trees = self._rng.choice(cell_count, spontaneous_count, replace=False)
+        new_trees = new_trees[empty_cells[new_trees]]
         
-        # Optimized tree spreading
-        if self.trees_config['spread_chance'] > 0 and np.any(empty_cells):
+        # Optimized tree spreading - random draws only for empty cells near a tree
+        if self.trees_config['spread_chance'] > 0:
             radius = int(self.trees_config['spread_radius'])
-            kernel = self.get_tree_kernel(radius)
             
-            tree_mask = (self.grid == 2)
-            if np.any(tree_mask):
-                nearby_trees = convolve(tree_mask.astype(np.uint8), kernel, mode='wrap')
-                can_spread = empty_cells & (nearby_trees > 0)
-                
-                if np.any(can_spread):
-                    self._random_array = np.random.random((self.height, self.width))
-                    new_trees = can_spread & (self._random_array < self.trees_config['spread_chance'])
-                    if np.any(new_trees):
-                        self.grid[new_trees] = 2
+            # Empty cells are never trees, so including the center cell is harmless
+            tree_mask = np.equal(self.grid, 2, out=self._cell_mask)
+            nearby_trees = self.get_tree_reach(self._pack_rows(tree_mask, plane=1), radius)
+            can_spread = np.flatnonzero(np.logical_and(self._empty_mask, self._unpack_rows(nearby_trees),
+                                                       out=self._cell_mask))
+            
+            spread = self._rng.random(can_spread.size, dtype=np.float32) < self.trees_config['spread_chance']
+            new_trees = np.concatenate((new_trees, can_spread[spread]))
+        
+        # Both kinds of new tree land in a single scatter
+        np.put(self.grid, new_trees, 2)
     
     def update_grid(self):
         """Apply all enabled rules in the correct order"""
         self.frame_count += 1
+        self._dirty = True
         
         # Apply trees rule FIRST so trees can grow
         self.apply_trees_rule()
@@ -264,6 +454,7 @@ class GameOfLife:
             for button in self.buttons:
                 if button['action'] == f'toggle_{rule_name}':
                     button['active'] = self.rules[rule_name]
+                    button['dirty'] = True
     
     def handle_button_click(self, pos):
         """Handle button clicks"""
@@ -279,6 +470,7 @@ class GameOfLife:
                     self.grid.fill(0)
                 elif button['action'] == 'toggle_ui':
                     self.ui_visible = not self.ui_visible
+                self._dirty = True
                 return True
         return False
     
@@ -295,74 +487,33 @@ class GameOfLife:
                     new_value = slider['min_val'] + percentage * (slider['max_val'] - slider['min_val'])
                 
                 slider['value'] = new_value
+                slider['dirty'] = True
                 self.trees_config[slider['param']] = new_value
+                self._dirty = True
                 return True
         return False
     
     def draw_ui(self):
-        """Draw the UI panel - optimized to reduce redundant drawing"""
+        """Draw the UI panel from cached surfaces, re-rendering only changed widgets"""
         if not self.ui_visible:
-            show_button = pygame.Rect(WIDTH - 30, 10, 20, 20)
-            pygame.draw.rect(self.screen, DARK_GRAY, show_button)
-            pygame.draw.rect(self.screen, WHITE, show_button, 2)
-            text = self.small_font.render('>', True, WHITE)
-            self.screen.blit(text, (show_button.x + 6, show_button.y + 2))
+            self.screen.blit(self._show_button_surface, (WIDTH - 30, 10))
             return
         
-        # Draw UI panel background
-        panel_rect = pygame.Rect(WIDTH - self.ui_panel_width, 0, self.ui_panel_width, HEIGHT)
-        pygame.draw.rect(self.screen, DARK_GRAY, panel_rect)
+        # Draw UI panel background and title
+        self.screen.blit(self._panel_surface, (WIDTH - self.ui_panel_width, 0))
         pygame.draw.line(self.screen, WHITE, (WIDTH - self.ui_panel_width, 0), (WIDTH - self.ui_panel_width, HEIGHT), 2)
         
-        # Draw title
-        title = self.font.render('Controls', True, WHITE)
-        self.screen.blit(title, (WIDTH - self.ui_panel_width + 20, 5))
-        
-        # Draw buttons
+        # Draw buttons, including the hide UI button
         for button in self.buttons:
-            if button['action'] == 'toggle_ui':
-                continue
-                
-            color = GREEN if button['active'] else RED
-            if button['action'] in ['randomize', 'clear']:
-                color = LIGHT_GRAY
-            
-            pygame.draw.rect(self.screen, color, button['rect'])
-            pygame.draw.rect(self.screen, WHITE, button['rect'], 2)
-            
-            text = self.font.render(button['text'], True, BLACK if color == LIGHT_GRAY else WHITE)
-            text_rect = text.get_rect(center=button['rect'].center)
-            self.screen.blit(text, text_rect)
+            if button['dirty']:
+                self._render_button(button)
+            self.screen.blit(button['cached_surface'], button['rect'])
         
         # Draw sliders
         for slider in self.sliders:
-            label_text = self.small_font.render(slider['label'], True, WHITE)
-            self.screen.blit(label_text, (slider['rect'].x, slider['rect'].y - 20))
-            
-            pygame.draw.rect(self.screen, GRAY, slider['rect'])
-            pygame.draw.rect(self.screen, WHITE, slider['rect'], 2)
-            
-            percentage = (slider['value'] - slider['min_val']) / (slider['max_val'] - slider['min_val'])
-            handle_x = slider['rect'].x + percentage * slider['rect'].width
-            handle_rect = pygame.Rect(handle_x - 5, slider['rect'].y - 2, 10, slider['rect'].height + 4)
-            pygame.draw.rect(self.screen, WHITE, handle_rect)
-            
-            if slider['param'] == 'spread_radius':
-                value_text = f"{int(slider['value'])}"
-            elif slider['param'] == 'spontaneous_chance':
-                value_text = f"{slider['value']:.6f}"
-            else:
-                value_text = f"{slider['value']:.4f}"
-            value_surface = self.small_font.render(value_text, True, WHITE)
-            self.screen.blit(value_surface, (slider['rect'].x + slider['rect'].width + 10, slider['rect'].y))
-        
-        # Draw hide UI button
-        hide_button = self.buttons[-1]
-        pygame.draw.rect(self.screen, RED, hide_button['rect'])
-        pygame.draw.rect(self.screen, WHITE, hide_button['rect'], 2)
-        text = self.small_font.render(hide_button['text'], True, WHITE)
-        text_rect = text.get_rect(center=hide_button['rect'].center)
-        self.screen.blit(text, text_rect)
+            if slider['dirty']:
+                self._render_slider(slider)
+            self.screen.blit(slider['cached_surface'], slider['rect'].move(-5, -20))
     
     def screen_to_grid(self, screen_x, screen_y):
         """Convert screen coordinates to grid coordinates"""
@@ -371,6 +522,10 @@ class GameOfLife:
     
     def draw(self):
         """Draw the grid to screen - heavily optimized rendering"""
+        # Nothing changed since the last frame (e.g. paused) - keep what is on screen
+        if not self._dirty:
+            return
+        
         self.screen.fill(BLACK)
         
         sim_width = WIDTH - (self.ui_panel_width if self.ui_visible else 0)
@@ -381,42 +536,33 @@ class GameOfLife:
         end_x = min(self.width, int(self.pan_x + sim_width / self.zoom_level) + 1)
         end_y = min(self.height, int(self.pan_y + HEIGHT / self.zoom_level) + 1)
         
-        visible_grid = self.grid[start_y:end_y, start_x:end_x]
+        w = end_x - start_x
+        h = end_y - start_y
         
-        if visible_grid.size > 0:
-            # Create RGB array more efficiently
-            h, w = visible_grid.shape
-            rgb_array = np.zeros((w, h, 3), dtype=np.uint8)
-            
-            # Use advanced indexing for faster color assignment
-            white_mask = visible_grid.T == 1
-            green_mask = visible_grid.T == 2
-            
-            rgb_array[white_mask] = WHITE
-            rgb_array[green_mask] = GREEN
+        if w > 0 and h > 0:
+            # The (H, W) C-order grid already has pygame's row-major pixel layout,
+            # so wrap its memory as a paletted surface instead of transposing a copy
+            grid_surface = pygame.image.frombuffer(self.grid, (self.width, self.height), 'P')
+            grid_surface.set_palette(self._palette)
+            visible_surface = grid_surface.subsurface((start_x, start_y, w, h))
             
             if abs(self.zoom_level - 1.0) < 0.01:  # Approximately 1x zoom
-                temp_surface = pygame.Surface((w, h))
-                pygame.surfarray.blit_array(temp_surface, rgb_array)
-                self.screen.blit(temp_surface, 
+                self.screen.blit(visible_surface, 
                                (int((start_x - self.pan_x) * self.zoom_level),
                                 int((start_y - self.pan_y) * self.zoom_level)))
             else:
-                if w > 0 and h > 0:
-                    temp_surface = pygame.Surface((w, h))
-                    pygame.surfarray.blit_array(temp_surface, rgb_array)
-                    
-                    scaled_width = max(1, int(w * self.zoom_level))
-                    scaled_height = max(1, int(h * self.zoom_level))
-                    
-                    scaled_surface = pygame.transform.scale(temp_surface, 
-                                                           (scaled_width, scaled_height))
-                    self.screen.blit(scaled_surface, 
-                                   (int((start_x - self.pan_x) * self.zoom_level),
-                                    int((start_y - self.pan_y) * self.zoom_level)))
+                scaled_width = max(1, int(w * self.zoom_level))
+                scaled_height = max(1, int(h * self.zoom_level))
+                
+                scaled_surface = pygame.transform.scale(visible_surface, 
+                                                       (scaled_width, scaled_height))
+                self.screen.blit(scaled_surface, 
+                               (int((start_x - self.pan_x) * self.zoom_level),
+                                int((start_y - self.pan_y) * self.zoom_level)))
         
         self.draw_ui()
         pygame.display.flip()
+        self._dirty = False
     
     def handle_mouse(self):
         """Optimized mouse handling"""
@@ -435,21 +581,19 @@ class GameOfLife:
         
         if mouse_buttons[0]:  # Left mouse button - draw
             cell_type = 2 if keys[pygame.K_LSHIFT] else 1
-            
-            x_start = max(0, grid_x - brush_size//2)
-            x_end = min(self.width, grid_x + brush_size//2 + 1)
-            y_start = max(0, grid_y - brush_size//2)
-            y_end = min(self.height, grid_y + brush_size//2 + 1)
-            
-            self.grid[y_start:y_end, x_start:x_end] = cell_type
-        
         elif mouse_buttons[2]:  # Right mouse button - erase
-            x_start = max(0, grid_x - brush_size//2)
-            x_end = min(self.width, grid_x + brush_size//2 + 1)
-            y_start = max(0, grid_y - brush_size//2)
-            y_end = min(self.height, grid_y + brush_size//2 + 1)
-            
-            self.grid[y_start:y_end, x_start:x_end] = 0
+            cell_type = 0
+        else:
+            return
+        
+        # The brush is a square, so one clipped slice assignment paints it
+        x_start = max(0, grid_x - brush_size//2)
+        x_end = min(self.width, grid_x + brush_size//2 + 1)
+        y_start = max(0, grid_y - brush_size//2)
+        y_end = min(self.height, grid_y + brush_size//2 + 1)
+        
+        self.grid[y_start:y_end, x_start:x_end] = cell_type
+        self._dirty = True
     
     def handle_zoom(self, event):
         """Handle zoom events"""
@@ -474,6 +618,7 @@ class GameOfLife:
         max_pan_y = max(0, self.height - HEIGHT / self.zoom_level)
         self.pan_x = max(0, min(max_pan_x, self.pan_x))
         self.pan_y = max(0, min(max_pan_y, self.pan_y))
+        self._dirty = True
     
     def run(self):
         """Main game loop - optimized"""
@@ -498,6 +643,7 @@ class GameOfLife:
                         self.zoom_level = 1
                         self.pan_x = 0
                         self.pan_y = 0
+                        self._dirty = True
                 elif event.type == pygame.MOUSEBUTTONDOWN:
                     if event.button == 1:
                         if not self.handle_button_click(event.pos):
@@ -533,14 +679,19 @@ class GameOfLife:
                         max_pan_y = max(0, self.height - HEIGHT / self.zoom_level)
                         self.pan_x = max(0, min(max_pan_x, self.pan_x))
                         self.pan_y = max(0, min(max_pan_y, self.pan_y))
+                        self._dirty = True
                         
                         last_mouse_pos = (mouse_x, mouse_y)
+                elif event.type in (pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED):
+                    # The window contents were lost and must be redrawn
+                    self._dirty = True
             
             # Only show UI toggle if UI is hidden
             if not self.ui_visible and pygame.mouse.get_pressed()[0]:
                 show_button = pygame.Rect(WIDTH - 30, 10, 20, 20)
                 if show_button.collidepoint(pygame.mouse.get_pos()):
                     self.ui_visible = True
+                    self._dirty = True
             
             self.handle_mouse()
             